@@ -1,3 +1,2 @@
 aiogram==2.25.1
 python-dotenv==1.0.1
-pytz==2024.1
\ No newline at end of file
@@ -513,12 +513,15 @@ bot.action('active_shifts', async (ctx) => {
 
     if (!shifts.length) return ctx.reply('📄 Активных смен нет');
 
-    let message = '📋 *Активные смены*\n';
+    const parts = ['📋 *Активные смены*\n'];
     shifts.forEach(shift => {
-      message += `\n🆔 *${shift.id}* @${escapeMarkdownV2(shift.username)} (${escapeMarkdownV2(shift.full_name)})\n`;
-      message += `📅 ${escapeMarkdownV2(shift.shift_date)} ⏰ ${escapeMarkdownV2(shift.start_time)}-${escapeMarkdownV2(shift.end_time)}\n`;
-      message += `📍 ${escapeMarkdownV2(shift.zone)}${shift.witag && shift.witag !== 'Нет' ? ` 🔖 ${escapeMarkdownV2(shift.witag)}` : ''}`;
+      parts.push(
+        `\n🆔 *${shift.id}* @${escapeMarkdownV2(shift.username)} (${escapeMarkdownV2(shift.full_name)})\n`,
+        `📅 ${escapeMarkdownV2(shift.shift_date)} ⏰ ${escapeMarkdownV2(shift.start_time)}-${escapeMarkdownV2(shift.end_time)}\n`,
+        `📍 ${escapeMarkdownV2(shift.zone)}${shift.witag && shift.witag !== 'Нет' ? ` 🔖 ${escapeMarkdownV2(shift.witag)}` : ''}`
+      );
     });
+    const message = parts.join('');
 
     await ctx.replyWithMarkdownV2(message);
   } catch (err) {
@@ -539,11 +542,12 @@ bot.action('timesheet', async (ctx) => {
     const values = response.data.values || [];
     if (!values.length) return ctx.reply('📄 Табель пуст');
 
-    let message = '📝 *Табель учета*\n```';
+    const parts = ['📝 *Табель учета*\n```'];
     values.forEach(row => {
-      message += `\n${row[0]}. ${row[1]} (@${row[2]})\nЗона: ${row[3]}${row[4] && row[4] !== 'Нет' ? `, Witag: ${row[4]}` : ''}\nДни: ${row[5]}\nСтатус: ${row[6]}\nВремя: ${row[7]}-${row[8]}${row[9] ? ` (Факт: ${row[9]})` : ''}, Отработано: ${row[10] || ''}`;
+      parts.push(`\n${row[0]}. ${row[1]} (@${row[2]})\nЗона: ${row[3]}${row[4] && row[4] !== 'Нет' ? `, Witag: ${row[4]}` : ''}\nДни: ${row[5]}\nСтатус: ${row[6]}\nВремя: ${row[7]}-${row[8]}${row[9] ? ` (Факт: ${row[9]})` : ''}, Отработано: ${row[10] || ''}`);
     });
-    message += '```';
+    parts.push('```');
+    const message = parts.join('');
 
     await ctx.replyWithMarkdownV2(message);
   } catch (err) {
@@ -814,12 +818,15 @@ bot.action('show_shifts_report', async (ctx) => {
 
     if (!shifts.length) return ctx.reply('📄 Нет зарегистрированных смен.');
 
-    let message = '📋 *Отчёт по сменам (/shifts)*\n';
+    const parts = ['📋 *Отчёт по сменам (/shifts)*\n'];
     shifts.forEach(shift => {
-      message += `\n🆔 *${shift.id}* @${escapeMarkdownV2(shift.username)} (${escapeMarkdownV2(shift.full_name)})\n`;
-      message += `📅 ${escapeMarkdownV2(shift.shift_date)} ⏰ ${escapeMarkdownV2(shift.start_time)}-${escapeMarkdownV2(shift.end_time)}\n`;
-      message += `Статус: ${escapeMarkdownV2(shift.status)}`;
+      parts.push(
+        `\n🆔 *${shift.id}* @${escapeMarkdownV2(shift.username)} (${escapeMarkdownV2(shift.full_name)})\n`,
+        `📅 ${escapeMarkdownV2(shift.shift_date)} ⏰ ${escapeMarkdownV2(shift.start_time)}-${escapeMarkdownV2(shift.end_time)}\n`,
+        `Статус: ${escapeMarkdownV2(shift.status)}`
+      );
     });
+    const message = parts.join('');
 
     await ctx.replyWithMarkdownV2(message);
   } catch (err) {